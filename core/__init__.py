@@ -12,6 +12,7 @@ This package implements the principle of 'Zwanglose Stabilität' (Effortless Sta
 from .stability_principle import (
     SystemState,
     Interaction,
+    EvolutionHistory,
     StabilityPrinciple,
     calculate_stability,
     simulate_evolution,
@@ -26,6 +27,7 @@ __license__ = 'MIT'
 __all__ = [
     'SystemState',
     'Interaction',
+    'EvolutionHistory',
     'StabilityPrinciple',
     'calculate_stability',
     'simulate_evolution',
@@ -0,0 +1,58 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""_step.pyx
+
+Optional compiled N-body step kernel for stability_principle.
+
+Build in place (requires Cython and a C compiler):
+
+    cythonize -i -3 core/_step.pyx
+
+For OpenMP threads and native SIMD:
+
+    CFLAGS="-O3 -ffast-math -fopenmp -march=native" LDFLAGS="-fopenmp" \
+        cythonize -i -3 core/_step.pyx
+
+Without the extension, stability_principle falls back to Numba (_step_numba.py,
+for large runs), then NumPy.
+"""
+
+from cython cimport floating
+from cython.parallel cimport prange
+from libc.math cimport sqrt
+
+
+def step(floating[:, ::1] positions, floating[:, ::1] velocities, floating[::1] masses,
+         floating[::1] energies, floating[:, ::1] forces, double dt):
+    """Advance all components by one time step in place (compiled kernel)."""
+    cdef Py_ssize_t n = positions.shape[0]
+    cdef Py_ssize_t i, j, k
+    cdef double ax, ay, az, dx, dy, dz, r2, scale, kinetic
+
+    with nogil:
+        # Forces are evaluated for the whole configuration before anything moves
+        for i in prange(n, schedule='static'):
+            ax = 0.0
+            ay = 0.0
+            az = 0.0
+            for j in range(n):
+                dx = positions[j, 0] - positions[i, 0]
+                dy = positions[j, 1] - positions[i, 1]
+                dz = positions[j, 2] - positions[i, 2]
+                r2 = dx * dx + dy * dy + dz * dz
+
+                # Zero force for coincident pairs (and i == j), as a select
+                scale = masses[j] / (r2 * sqrt(r2)) if r2 >= 1e-20 else 0.0
+                ax = ax + scale * dx
+                ay = ay + scale * dy
+                az = az + scale * dz
+            forces[i, 0] = ax
+            forces[i, 1] = ay
+            forces[i, 2] = az
+
+        for i in prange(n, schedule='static'):
+            kinetic = 0.0
+            for k in range(3):
+                velocities[i, k] = velocities[i, k] + forces[i, k] * dt
+                positions[i, k] = positions[i, k] + velocities[i, k] * dt
+                kinetic = kinetic + velocities[i, k] * velocities[i, k]
+            energies[i] = 0.5 * masses[i] * kinetic
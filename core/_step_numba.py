@@ -0,0 +1,47 @@
+"""_step_numba.py
+
+Optional Numba N-body step kernel for stability_principle.
+
+Imported lazily by stability_principle the first time a system large enough
+to benefit is simulated, so `import core` never pays numba's import time.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def step(positions, velocities, masses, energies, forces, dt):
+    """Advance all components by one time step in place (Numba kernel)."""
+    n = positions.shape[0]
+    accelerations = forces  # Scratch buffer, every row is overwritten
+
+    # Forces are evaluated for the whole configuration before anything moves
+    for i in prange(n):
+        ax = 0.0
+        ay = 0.0
+        az = 0.0
+        for j in range(n):
+            dx = positions[j, 0] - positions[i, 0]
+            dy = positions[j, 1] - positions[i, 1]
+            dz = positions[j, 2] - positions[i, 2]
+            r2 = dx * dx + dy * dy + dz * dz
+
+            # Branchless zero force for coincident pairs (and i == j)
+            separated = r2 >= 1e-20
+            r2 = max(r2, 1e-20)
+            scale = separated * masses[j] / (r2 * np.sqrt(r2))
+            ax += scale * dx
+            ay += scale * dy
+            az += scale * dz
+        accelerations[i, 0] = ax
+        accelerations[i, 1] = ay
+        accelerations[i, 2] = az
+
+    for i in prange(n):
+        kinetic = 0.0
+        for k in range(3):
+            velocities[i, k] += accelerations[i, k] * dt
+            positions[i, k] += velocities[i, k] * dt
+            kinetic += velocities[i, k] * velocities[i, k]
+        energies[i] = 0.5 * masses[i] * kinetic
@@ -6,8 +6,10 @@ applies across all scales - from quantum to cosmic to consciousness.
 The fractal nature: What works at one scale works at all scales.
 """
 
+import math
 import numpy as np
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Tuple
 from enum import Enum
 
@@ -25,7 +27,7 @@ class Scale(Enum):
     CONSCIOUSNESS = "consciousness"  # Thoughts and ideas
 
 
-@dataclass
+@dataclass(frozen=True)
 class FractalPattern:
     """Represents a pattern that repeats across scales"""
     scale: Scale
@@ -44,6 +46,36 @@ class FractalPattern:
         return self.is_stable() and self.interaction_strength < 0.5
 
 
+def _log(x: float) -> float:
+    """math.log with np.log's results outside its domain: -inf at 0, nan below"""
+    if x > 0:
+        return math.log(x)
+    return -math.inf if x == 0 else math.nan
+
+
+@lru_cache(maxsize=4096)
+def _similarity(
+    interaction_a: float,
+    stability_a: float,
+    interaction_b: float,
+    stability_b: float
+) -> float:
+    """Similarity of two patterns from their interaction and stability measures"""
+    interaction_similarity = 1.0 - abs(interaction_a - interaction_b)
+    stability_similarity = 1.0 - abs(stability_a - stability_b)
+    return (interaction_similarity + stability_similarity) / 2.0
+
+
+def _similarity_matrix(patterns: List[FractalPattern]) -> np.ndarray:
+    """Pairwise similarity of all patterns in one broadcast (same formula as _similarity)"""
+    interaction = np.array([p.interaction_strength for p in patterns], dtype=float)
+    stability = np.array([p.stability_measure for p in patterns], dtype=float)
+    
+    interaction_similarity = 1.0 - np.abs(interaction[:, None] - interaction[None, :])
+    stability_similarity = 1.0 - np.abs(stability[:, None] - stability[None, :])
+    return (interaction_similarity + stability_similarity) / 2.0
+
+
 class FractalAnalyzer:
     """Analyzes fractal patterns across scales"""
     
@@ -59,25 +91,12 @@ class FractalAnalyzer:
         Analyze how similar patterns are across different scales.
         Returns similarity score (0.0 to 1.0)
         """
-        # Normalize by component count (scaling factor)
-        components_ratio = min(
-            pattern_a.components / pattern_b.components,
-            pattern_b.components / pattern_a.components
-        )
-        
-        # Compare interaction patterns
-        interaction_similarity = 1.0 - abs(
-            pattern_a.interaction_strength - pattern_b.interaction_strength
+        return _similarity(
+            pattern_a.interaction_strength,
+            pattern_a.stability_measure,
+            pattern_b.interaction_strength,
+            pattern_b.stability_measure
         )
-        
-        # Compare stability
-        stability_similarity = 1.0 - abs(
-            pattern_a.stability_measure - pattern_b.stability_measure
-        )
-        
-        # Overall similarity
-        similarity = (interaction_similarity + stability_similarity) / 2.0
-        return similarity
     
     def find_fractal_repetition(
         self,
@@ -87,21 +106,15 @@ class FractalAnalyzer:
         Find where patterns repeat across scales.
         Returns list of (scale_a, scale_b, similarity) tuples.
         """
-        repetitions = []
+        similarities = _similarity_matrix(patterns)
         
-        for i in range(len(patterns)):
-            for j in range(i + 1, len(patterns)):
-                similarity = self.analyze_scale_similarity(
-                    patterns[i],
-                    patterns[j]
-                )
-                
-                if similarity > 0.7:  # High similarity = fractal repetition
-                    repetitions.append((
-                        patterns[i].scale,
-                        patterns[j].scale,
-                        similarity
-                    ))
+        # High similarity = fractal repetition; scan only the upper triangle (i < j)
+        matches = np.argwhere(np.triu(similarities > 0.7, k=1))
+        
+        repetitions = [
+            (patterns[i].scale, patterns[j].scale, float(similarities[i, j]))
+            for i, j in matches
+        ]
         
         return repetitions
     
@@ -118,15 +131,30 @@ class FractalAnalyzer:
         # Simplified fractal dimension calculation
         # Based on how components and interactions scale
         
-        log_components = np.log(pattern.components)
-        log_scale = np.log(scale_factor)
+        log_scale = _log(scale_factor)
         
         if log_scale == 0:
             return 1.0
         
-        dimension = log_components / log_scale
+        dimension = _log(pattern.components) / log_scale
         return dimension
     
+    def calculate_fractal_dimension_batch(
+        self,
+        patterns: List[FractalPattern],
+        scale_factor: float = 2.0
+    ) -> np.ndarray:
+        """
+        Fractal dimension of many patterns at once (see calculate_fractal_dimension).
+        """
+        log_scale = _log(scale_factor)
+        
+        if log_scale == 0:
+            return np.ones(len(patterns))
+        
+        components = np.array([p.components for p in patterns], dtype=float)
+        return np.log(components) / log_scale
+    
     def demonstrate_universality(self) -> Dict[str, any]:
         """
         Demonstrate that zwanglose Stabilität is universal across scales.
@@ -178,15 +206,16 @@ class FractalAnalyzer:
         # Find fractal repetitions
         repetitions = self.find_fractal_repetition(patterns)
         
-        # Check which patterns show effortless stability
-        effortless_patterns = [
-            p for p in patterns if p.is_effortless()
-        ]
+        # Check which patterns show effortless stability - FractalPattern.is_effortless
+        # for all patterns at once (is_stable's interaction < 0.8 is implied by < 0.5)
+        stability = np.array([p.stability_measure for p in patterns])
+        interaction = np.array([p.interaction_strength for p in patterns])
+        effortless_mask = (stability > 0.6) & (interaction < 0.5)
         
         return {
             'total_patterns_analyzed': len(patterns),
             'fractal_repetitions': repetitions,
-            'effortless_patterns': len(effortless_patterns),
+            'effortless_patterns': int(effortless_mask.sum()),
             'universality_confirmed': len(repetitions) > 0,
             'patterns': patterns
         }
@@ -12,7 +12,7 @@ Durch welche zwanglose Interaktion? -> Through natural affinity and balance
 
 import numpy as np
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Mapping, Sequence
 from enum import Enum
 
 
@@ -25,6 +25,127 @@ class InteractionType(Enum):
     NEUTRAL = "neutral"        # No significant interaction
 
 
+# Fixed feature layout for vectorized classification (NaN = property absent;
+# spin holds equality codes, see _SpinCodes)
+_FEATURE_KEYS = ('frequency', 'charge', 'energy_level', 'spin')
+
+# Interaction types in the priority order calculate_interaction_strength checks them
+_TYPE_ORDER = (
+    InteractionType.RESONANCE,
+    InteractionType.ATTRACTION,
+    InteractionType.REPULSION,
+    InteractionType.EXCHANGE,
+    InteractionType.NEUTRAL,
+)
+_RESONANCE, _ATTRACTION, _REPULSION, _EXCHANGE, _NEUTRAL = range(len(_TYPE_ORDER))
+
+
+def _property(component, key: str, default=None):
+    """
+    Property of a component given either as a dict or as an object with
+    attributes (e.g. a particle record); `default` when it is absent.
+    """
+    if isinstance(component, Mapping):
+        return component.get(key, default)
+    return getattr(component, key, default)
+
+
+class _SpinCodes:
+    """
+    Numeric equality codes for spin values: spins that compare equal (by ==,
+    as _check_repulsion compares them) share a code, so spins need not be
+    numeric. Share one instance across feature matrices compared together.
+    """
+    
+    def __init__(self):
+        self._codes: Dict = {}
+        self._unhashable: List[Tuple[object, float]] = []
+        self._next = 0.0
+    
+    def _new_code(self) -> float:
+        code = self._next
+        self._next += 1.0
+        return code
+    
+    def __call__(self, value) -> float:
+        if value != value:  # NaN equals nothing, not even itself
+            return self._new_code()
+        try:
+            code = self._codes.get(value)
+            if code is None:
+                code = self._codes[value] = self._new_code()
+            return code
+        except TypeError:  # unhashable spin: linear == search
+            for seen, code in self._unhashable:
+                if seen == value:
+                    return code
+            code = self._new_code()
+            self._unhashable.append((value, code))
+            return code
+
+
+def _feature_matrix(components: List[Dict], spin_codes: Optional[_SpinCodes] = None) -> np.ndarray:
+    """
+    Stack component properties into an (N, 4) array following _FEATURE_KEYS.
+    
+    The spin column holds equality codes from `spin_codes` rather than the
+    spins themselves; pass the same instance for matrices compared together.
+    """
+    if spin_codes is None:
+        spin_codes = _SpinCodes()
+    spin_column = _FEATURE_KEYS.index('spin')
+    features = np.full((len(components), len(_FEATURE_KEYS)), np.nan)
+    for i, component in enumerate(components):
+        for k, key in enumerate(_FEATURE_KEYS):
+            value = _property(component, key)
+            if value is not None:
+                features[i, k] = spin_codes(value) if k == spin_column else value
+    return features
+
+
+def _classify(
+    features_a: np.ndarray,
+    features_b: np.ndarray,
+    distance: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Branchless, broadcasting version of calculate_interaction_strength.
+    
+    features_a/features_b hold _FEATURE_KEYS along the last axis.
+    Returns (type codes indexing _TYPE_ORDER, strengths).
+    """
+    freq_a, charge_a, energy_a, spin_a = np.moveaxis(features_a, -1, 0)
+    freq_b, charge_b, energy_b, spin_b = np.moveaxis(features_b, -1, 0)
+    
+    # Resonance: similar frequencies
+    has_freq = ~np.isnan(freq_a) & ~np.isnan(freq_b)
+    resonance = np.where(has_freq, 1.0 / (1.0 + np.abs(freq_a - freq_b)), 0.0)
+    
+    # Attraction: opposite charges, similar energy levels
+    has_charge = ~np.isnan(charge_a) & ~np.isnan(charge_b)
+    charge_product = charge_a * charge_b
+    similar_energy = np.abs(energy_a - energy_b) < 0.3  # False when either is absent
+    attraction = np.minimum(
+        np.where(has_charge & (charge_product < 0), 0.8, 0.0)
+        + np.where(similar_energy, 0.4, 0.0),
+        1.0
+    )
+    
+    # Repulsion: same charges, same spin (Pauli exclusion)
+    same_spin = spin_a == spin_b  # False when either is absent
+    repulsion = np.minimum(
+        np.where(has_charge & (charge_product > 0), 0.7 * np.abs(charge_product), 0.0)
+        + np.where(same_spin, 0.6, 0.0),
+        1.0
+    )
+    
+    # First matching condition wins, as in the scalar cascade
+    conditions = [resonance > 0.7, attraction > 0.5, repulsion > 0.5, distance < 1.0]
+    types = np.select(conditions, [_RESONANCE, _ATTRACTION, _REPULSION, _EXCHANGE], _NEUTRAL)
+    strengths = np.select(conditions, [resonance, attraction, repulsion, 0.3], 0.0)
+    return types, strengths
+
+
 @dataclass
 class InteractionField:
     """Represents the field through which interactions happen"""
@@ -47,6 +168,42 @@ class InteractionField:
         return max(0.0, effect)
 
 
+@dataclass(eq=False)
+class InteractionTrace(Sequence):
+    """
+    Trajectory of a simulated two-component interaction, one entry per step.
+    
+    distance and strength are float64 arrays, interaction_type_id an int8
+    array indexing interaction_type_names, effortless a bool array.
+    Indexing a step builds the familiar state dict on demand:
+    {'step', 'distance', 'interaction_type', 'strength', 'effortless'}.
+    """
+    distance: np.ndarray
+    strength: np.ndarray
+    interaction_type_id: np.ndarray
+    effortless: np.ndarray
+    interaction_type_names: Tuple[str, ...] = tuple(t.value for t in _TYPE_ORDER)
+    
+    def interaction_type(self, step: int) -> InteractionType:
+        """Decode the interaction type at a step"""
+        return InteractionType(self.interaction_type_names[self.interaction_type_id[step]])
+    
+    def __len__(self) -> int:
+        return len(self.distance)
+    
+    def __getitem__(self, step):
+        if isinstance(step, slice):
+            return [self[i] for i in range(*step.indices(len(self)))]
+        
+        return {
+            'step': range(len(self))[step],
+            'distance': float(self.distance[step]),
+            'interaction_type': self.interaction_type(step).value,
+            'strength': float(self.strength[step]),
+            'effortless': bool(self.effortless[step]),
+        }
+
+
 class InteractionDynamics:
     """Models how components interact naturally and effortlessly"""
     
@@ -62,6 +219,9 @@ class InteractionDynamics:
         """
         Calculate natural interaction between two components.
         
+        Components are property dicts or objects exposing the same
+        properties as attributes (frequency, charge, energy_level, spin).
+        
         Returns:
             (InteractionType, strength): Type and strength of interaction
         """
@@ -98,10 +258,49 @@ class InteractionDynamics:
         
         return InteractionType.NEUTRAL, 0.0
     
+    def calculate_interaction_strength_batch(
+        self,
+        components_a: List[Dict],
+        components_b: List[Dict],
+        distances
+    ) -> Tuple[List[InteractionType], np.ndarray]:
+        """
+        Calculate natural interactions for many component pairs at once.
+        
+        Pair i is (components_a[i], components_b[i]) at distances[i]; a scalar
+        distance applies to every pair. Same rules as calculate_interaction_strength.
+        
+        Returns:
+            (types, strengths): InteractionType per pair and a strength array
+        
+        Raises:
+            ValueError: if components_b or a distances sequence does not have
+                one entry per component of components_a
+        """
+        n = len(components_a)
+        if len(components_b) != n:
+            raise ValueError(
+                f"components_a and components_b must have the same length, got {n} and {len(components_b)}"
+            )
+        
+        distances = np.asarray(distances, dtype=np.float64)
+        if distances.ndim != 0 and distances.shape != (n,):
+            raise ValueError(f"distances must be a scalar or have shape ({n},), got {distances.shape}")
+        distances = np.broadcast_to(distances, (n,))
+        spin_codes = _SpinCodes()
+        codes, strengths = _classify(
+            _feature_matrix(components_a, spin_codes),
+            _feature_matrix(components_b, spin_codes),
+            distances
+        )
+        return [_TYPE_ORDER[code] for code in codes], strengths
+    
     def _check_resonance(self, props_a: Dict, props_b: Dict) -> float:
         """Check if components resonate (have similar frequencies/properties)"""
-        if 'frequency' in props_a and 'frequency' in props_b:
-            freq_diff = abs(props_a['frequency'] - props_b['frequency'])
+        freq_a = _property(props_a, 'frequency')
+        freq_b = _property(props_b, 'frequency')
+        if freq_a is not None and freq_b is not None:
+            freq_diff = abs(freq_a - freq_b)
             # Perfect resonance at freq_diff = 0, decreases with difference
             resonance = 1.0 / (1.0 + freq_diff)
             return resonance
@@ -112,14 +311,18 @@ class InteractionDynamics:
         attraction = 0.0
         
         # Check charge complementarity
-        if 'charge' in props_a and 'charge' in props_b:
-            charge_product = props_a['charge'] * props_b['charge']
+        charge_a = _property(props_a, 'charge')
+        charge_b = _property(props_b, 'charge')
+        if charge_a is not None and charge_b is not None:
+            charge_product = charge_a * charge_b
             if charge_product < 0:  # Opposite charges attract
                 attraction += 0.8
         
         # Check energy compatibility
-        if 'energy_level' in props_a and 'energy_level' in props_b:
-            energy_diff = abs(props_a['energy_level'] - props_b['energy_level'])
+        energy_a = _property(props_a, 'energy_level')
+        energy_b = _property(props_b, 'energy_level')
+        if energy_a is not None and energy_b is not None:
+            energy_diff = abs(energy_a - energy_b)
             if energy_diff < 0.3:  # Similar energy levels
                 attraction += 0.4
         
@@ -130,14 +333,18 @@ class InteractionDynamics:
         repulsion = 0.0
         
         # Check charge repulsion
-        if 'charge' in props_a and 'charge' in props_b:
-            charge_product = props_a['charge'] * props_b['charge']
+        charge_a = _property(props_a, 'charge')
+        charge_b = _property(props_b, 'charge')
+        if charge_a is not None and charge_b is not None:
+            charge_product = charge_a * charge_b
             if charge_product > 0:  # Same charges repel
                 repulsion += 0.7 * abs(charge_product)
         
         # Check incompatible properties
-        if 'spin' in props_a and 'spin' in props_b:
-            if props_a['spin'] == props_b['spin']:
+        spin_a = _property(props_a, 'spin')
+        spin_b = _property(props_b, 'spin')
+        if spin_a is not None and spin_b is not None:
+            if spin_a == spin_b:
                 # Pauli exclusion principle - same spin repel
                 repulsion += 0.6
         
@@ -148,46 +355,49 @@ class InteractionDynamics:
         component_a: Dict,
         component_b: Dict,
         time_steps: int = 100
-    ) -> List[Dict]:
+    ) -> InteractionTrace:
         """
         Simulate natural interaction over time.
         
         Returns:
-            List of interaction states over time
+            InteractionTrace of the interaction states over time
         """
-        states = []
-        distance = component_a.get('distance', 10.0)
-        
-        for step in range(time_steps):
-            # Calculate current interaction
-            interaction_type, strength = self.calculate_interaction_strength(
-                component_a,
-                component_b,
-                distance
-            )
-            
-            # Update distance based on interaction
-            if interaction_type == InteractionType.ATTRACTION:
-                distance *= (1.0 - 0.1 * strength)
-            elif interaction_type == InteractionType.REPULSION:
-                distance *= (1.0 + 0.1 * strength)
-            
-            state = {
-                'step': step,
-                'distance': distance,
-                'interaction_type': interaction_type.value,
-                'strength': strength,
-                'effortless': strength > 0.5,  # High strength = effortless
-            }
-            states.append(state)
-            
-            # Natural stopping condition - stable state reached
-            if len(states) > 10:
-                recent_distances = [s['distance'] for s in states[-10:]]
-                if max(recent_distances) - min(recent_distances) < 0.01:
-                    break
+        distance = _property(component_a, 'distance', 10.0)
+        
+        # Properties never change and distance only decides EXCHANGE vs NEUTRAL,
+        # neither of which moves the components - so type and strength are the
+        # same at every step and the trajectory is a geometric sequence
+        interaction_type, strength = self.calculate_interaction_strength(
+            component_a,
+            component_b,
+            distance
+        )
+        
+        if interaction_type == InteractionType.ATTRACTION:
+            factor = 1.0 - 0.1 * strength
+        elif interaction_type == InteractionType.REPULSION:
+            factor = 1.0 + 0.1 * strength
+        else:
+            factor = 1.0
         
-        return states
+        # Sequential product, same rounding as updating distance step by step
+        distances = np.cumprod(np.r_[distance, np.full(time_steps, factor)])[1:]
+        
+        # Natural stopping condition - stable state reached: first step after
+        # the 10th whose last 10 distances span less than 0.01
+        if time_steps > 10:
+            windows = np.lib.stride_tricks.sliding_window_view(distances, 10)[1:]
+            settled = np.flatnonzero(np.ptp(windows, axis=1) < 0.01)
+            if settled.size:
+                distances = distances[:settled[0] + 11]
+        
+        steps = len(distances)
+        return InteractionTrace(
+            distance=distances,
+            strength=np.full(steps, strength),
+            interaction_type_id=np.full(steps, _TYPE_ORDER.index(interaction_type), dtype=np.int8),
+            effortless=np.full(steps, strength > 0.5),  # High strength = effortless
+        )
     
     def find_natural_equilibrium(
         self,
@@ -200,45 +410,22 @@ class InteractionDynamics:
         This is where the system naturally settles without external force.
         """
         current_config = [c.copy() for c in components]
-        energy_history = []
-        
-        for iteration in range(max_iterations):
-            total_energy = 0.0
-            
-            # Calculate all pairwise interactions
-            for i in range(len(current_config)):
-                for j in range(i + 1, len(current_config)):
-                    comp_a = current_config[i]
-                    comp_b = current_config[j]
-                    
-                    distance = self._calculate_distance(comp_a, comp_b)
-                    int_type, strength = self.calculate_interaction_strength(
-                        comp_a,
-                        comp_b,
-                        distance
-                    )
-                    
-                    # Accumulate energy
-                    if int_type == InteractionType.ATTRACTION:
-                        total_energy -= strength  # Attraction lowers energy
-                    elif int_type == InteractionType.REPULSION:
-                        total_energy += strength  # Repulsion raises energy
-            
-            energy_history.append(total_energy)
-            
-            # Check for equilibrium (energy stabilized)
-            if len(energy_history) > 20:
-                recent_energies = energy_history[-20:]
-                energy_variance = np.var(recent_energies)
-                if energy_variance < 0.001:
-                    # Equilibrium reached
-                    return {
-                        'configuration': current_config,
-                        'energy': total_energy,
-                        'iterations': iteration,
-                        'stable': True,
-                        'effortless': True  # Natural equilibrium is effortless
-                    }
+        
+        # The search never moves components, so the pairwise energy of the
+        # configuration is the same at every iteration: evaluate all pairs once
+        total_energy = self._pairwise_energy(current_config)
+        
+        # A constant energy has zero variance over any 20-iteration window, so
+        # equilibrium is reached as soon as 21 energies are on record
+        settled_at = 20
+        if max_iterations > settled_at:
+            return {
+                'configuration': current_config,
+                'energy': total_energy,
+                'iterations': settled_at,
+                'stable': True,
+                'effortless': True  # Natural equilibrium is effortless
+            }
         
         return {
             'configuration': current_config,
@@ -248,13 +435,24 @@ class InteractionDynamics:
             'effortless': False
         }
     
-    def _calculate_distance(self, comp_a: Dict, comp_b: Dict) -> float:
-        """Calculate distance between two components"""
-        if 'position' in comp_a and 'position' in comp_b:
-            pos_a = np.array(comp_a['position'])
-            pos_b = np.array(comp_b['position'])
-            return np.linalg.norm(pos_a - pos_b)
-        return comp_a.get('distance', 5.0)
+    def _pairwise_energy(self, components: List[Dict]) -> float:
+        """
+        Total interaction energy over all component pairs, in one vectorized pass.
+        
+        Attraction lowers energy, repulsion raises it; each pair counts once.
+        Distance only decides between EXCHANGE and NEUTRAL, which both carry
+        zero energy, so pair distances are never computed.
+        """
+        features = _feature_matrix(components)
+        types, strengths = _classify(
+            features[:, None, :],
+            features[None, :, :],
+            np.inf
+        )
+        
+        pair_energy = np.where(types == _ATTRACTION, -strengths, 0.0)
+        pair_energy = np.where(types == _REPULSION, strengths, pair_energy)
+        return float(np.triu(pair_energy, k=1).sum())
 
 
 def demonstrate_interaction_dynamics():
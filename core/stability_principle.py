@@ -6,13 +6,22 @@ Defines how systems evolve toward stable states through natural interactions.
 """
 
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, Sequence
 from dataclasses import dataclass
 
+try:
+    from ._step import step as _step_compiled
+except ImportError:  # compiled kernel (_step.pyx) is optional
+    _step_compiled = None
+
 
 @dataclass
 class SystemState:
     """Represents the state of a system component."""
+    __slots__ = ('id', 'position', 'velocity', 'mass', 'energy')
+    
     id: int
     position: np.ndarray
     velocity: np.ndarray
@@ -29,6 +38,8 @@ class SystemState:
 @dataclass
 class Interaction:
     """Represents an interaction between system components."""
+    __slots__ = ('source_id', 'target_id', 'force', 'interaction_type', 'strength')
+    
     source_id: int
     target_id: int
     force: np.ndarray
@@ -36,6 +47,150 @@ class Interaction:
     strength: float
 
 
+class EvolutionHistory(Sequence):
+    """
+    Recorded evolution of a system, stored as preallocated arrays.
+    
+    One row per time step: time, total_energy and avg_stability (steps,),
+    plus - for full records only - positions/velocities (steps, N, 3) and
+    energies/stabilities (steps, N); these are None in summary records.
+    Indexing a step builds the familiar snapshot dict on demand:
+    {'time', 'states', 'total_energy', 'avg_stability'} ('states' only when full).
+    """
+    
+    def __init__(self, ids: List[int], steps: int, dtype=np.float64, full: bool = True):
+        n = len(ids)
+        self.ids = list(ids)
+        self.full = full
+        self.time = np.empty(steps)
+        self.total_energy = np.empty(steps)
+        self.avg_stability = np.empty(steps)
+        
+        self.positions = np.empty((steps, n, 3), dtype=dtype) if full else None
+        self.velocities = np.empty((steps, n, 3), dtype=dtype) if full else None
+        self.energies = np.empty((steps, n), dtype=dtype) if full else None
+        self.stabilities = np.empty((steps, n), dtype=dtype) if full else None
+    
+    def __len__(self) -> int:
+        return len(self.time)
+    
+    def __getitem__(self, step):
+        if isinstance(step, slice):
+            return [self[i] for i in range(*step.indices(len(self)))]
+        
+        snapshot = {'time': float(self.time[step])}
+        if self.full:
+            snapshot['states'] = [
+                {
+                    'id': state_id,
+                    'position': self.positions[step, i],
+                    'velocity': self.velocities[step, i],
+                    'energy': float(self.energies[step, i]),
+                    'stability': float(self.stabilities[step, i])
+                }
+                for i, state_id in enumerate(self.ids)
+            ]
+        snapshot['total_energy'] = float(self.total_energy[step])
+        snapshot['avg_stability'] = float(self.avg_stability[step])
+        return snapshot
+
+
+@lru_cache(maxsize=8)
+def _pair_indices(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Index arrays (iu, ju) of the n(n-1)/2 unordered pairs i < j, cached per n."""
+    return np.triu_indices(n, k=1)
+
+
+def _net_accelerations(positions: np.ndarray, masses: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Acceleration of every component from all pairwise interactions, written into `out`.
+    
+    Vectorized form of evaluate_interaction summed over all pairs and divided
+    by the component's own mass. Like the compiled and Numba kernels it never
+    divides by m_i, so massless components get the same finite acceleration
+    whichever kernel runs:
+    a_i = sum_j m_j * (x_j - x_i) / r_ij^3
+    Coincident pairs (r < 1e-10) contribute nothing. Each unordered pair
+    is evaluated once and scattered to both ends.
+    """
+    iu, ju = _pair_indices(len(masses))
+    
+    # diff[p] points from component iu[p] toward component ju[p]
+    diff = positions[ju] - positions[iu]
+    r2 = np.einsum('ij,ij->i', diff, diff)
+    
+    # Avoid division by zero without branching:
+    # an infinite separation makes the inverse cube exactly zero
+    inv_r3 = np.where(r2 < 1e-20, np.inf, r2) ** -1.5
+    pull_j = masses[ju] * inv_r3  # pull on iu[p] from ju[p], per unit separation
+    pull_i = masses[iu] * inv_r3  # pull on ju[p] from iu[p], per unit separation
+    
+    # Scatter per axis with bincount (much faster than np.add.at)
+    n = len(masses)
+    for k in range(3):
+        d = diff[:, k]
+        out[:, k] = np.bincount(iu, pull_j * d, n) - np.bincount(ju, pull_i * d, n)
+    return out
+
+
+def _step_numpy(positions: np.ndarray, velocities: np.ndarray, masses: np.ndarray,
+                energies: np.ndarray, forces: np.ndarray, dt: float):
+    """
+    Advance all components by one time step in place (NumPy kernel).
+    
+    `forces` is an (N, 3) scratch buffer reused across steps. The update runs
+    in place on it and the state arrays (all C-contiguous), so no further
+    (N, 3) temporaries are allocated.
+    """
+    delta = _net_accelerations(positions, masses, out=forces)
+    delta *= dt                                 # velocity change
+    velocities += delta
+    np.multiply(velocities, dt, out=delta)      # position change
+    positions += delta
+    np.einsum('ij,ij->i', velocities, velocities, out=energies)
+    energies *= 0.5 * masses
+
+
+# Numba's import and cached-kernel load cost ~0.4 s on first use, about what
+# the NumPy kernel needs for 1e7 pair-steps (n^2 * steps); smaller runs stay
+# on NumPy and never import numba
+_NUMBA_MIN_WORK = 10_000_000
+
+_step_numba = None  # Numba kernel, imported on first use (False if unavailable)
+
+
+def _select_step(n: int, steps: int):
+    """Fastest kernel for a run: compiled extension, then Numba (large runs only), then NumPy"""
+    global _step_numba
+    if _step_compiled is not None:
+        return _step_compiled
+    if n * n * steps < _NUMBA_MIN_WORK:
+        return _step_numpy
+    if _step_numba is None:
+        try:
+            from ._step_numba import step as _step_numba
+        except ImportError:  # numba is optional - fall back to the NumPy kernel
+            _step_numba = False
+    return _step_numba or _step_numpy
+
+
+_INTERACTION_CACHE_SIZE = 65536
+
+
+def _pair_force(r_vec: np.ndarray, mass_product: float) -> Tuple[np.ndarray, float]:
+    """Force on the source component and its strength for separation r_vec (source -> target)."""
+    r = np.linalg.norm(r_vec)
+    
+    if r < 1e-10:  # Avoid division by zero
+        return np.zeros_like(r_vec), 0.0
+    
+    # Simple gravitational-like interaction
+    # F = G * m1 * m2 / r^2, direction toward each other
+    r_hat = r_vec / r
+    strength = mass_product / (r * r)
+    return strength * r_hat, strength
+
+
 class StabilityPrinciple:
     """
     Core class implementing Zwanglose Stabilität (Effortless Stability).
@@ -44,17 +199,116 @@ class StabilityPrinciple:
     stability without external control or predetermined design.
     """
     
-    def __init__(self):
+    def __init__(self, cache_interactions: bool = False, dtype=np.float64):
+        """
+        Args:
+            cache_interactions: Memoize evaluate_interaction on the exact pair
+                geometry (separation vector, mass product). Pays off when the same
+                configurations are evaluated repeatedly; off by default since
+                building the key costs about as much as a single evaluation.
+            dtype: Floating type of the state buffers. np.float32 halves memory
+                traffic and doubles SIMD width in the N-body kernel; fine for
+                qualitative stability demonstrations where numerical accuracy
+                is not the main concern, but results drift from float64 runs.
+        """
         self.states: List[SystemState] = []
-        self.interactions: List[Interaction] = []
         self.time: float = 0.0
         self.dt: float = 0.01
         
+        self.cache_interactions = cache_interactions
+        self._interaction_cache: "OrderedDict[tuple, Tuple[np.ndarray, float]]" = OrderedDict()
+        self._seen_pairs = set()  # Admission filter: cache a pair only once it recurs
+        
+        # Contiguous (structure-of-arrays) storage backing self.states
+        self.dtype = np.dtype(dtype)
+        self._pos = np.empty((0, 3), dtype=self.dtype)
+        self._vel = np.empty((0, 3), dtype=self.dtype)
+        self._mass = np.empty(0, dtype=self.dtype)
+        self._energy = np.empty(0, dtype=self.dtype)
+        self._forces = np.empty((0, 3), dtype=self.dtype)  # Step kernel scratch
+        
+    def _reserve(self, capacity: int):
+        """Grow the state buffers (doubling) to hold at least `capacity` components."""
+        if capacity <= len(self._mass):
+            return
+        
+        n = len(self.states)
+        new_capacity = max(capacity, 2 * len(self._mass), 4)
+        
+        pos = np.zeros((new_capacity, 3), dtype=self.dtype)
+        vel = np.zeros((new_capacity, 3), dtype=self.dtype)
+        mass = np.zeros(new_capacity, dtype=self.dtype)
+        energy = np.zeros(new_capacity, dtype=self.dtype)
+        pos[:n] = self._pos[:n]
+        vel[:n] = self._vel[:n]
+        mass[:n] = self._mass[:n]
+        energy[:n] = self._energy[:n]
+        self._pos, self._vel, self._mass, self._energy = pos, vel, mass, energy
+        self._forces = np.empty((new_capacity, 3), dtype=self.dtype)
+        
+        # Re-point existing states at the new buffers
+        for i, state in enumerate(self.states):
+            state.position = self._pos[i]
+            state.velocity = self._vel[i]
+        
     def add_state(self, state: SystemState):
-        """Add a component to the system."""
+        """
+        Add a component to the system.
+        
+        From here on the state's position and velocity are views into the
+        system's contiguous buffers, so the simulation updates them in place.
+        Later changes to the state (mass, energy, reassigned arrays) are read
+        back in at the start of every simulation and stability scan.
+        """
+        i = len(self.states)
+        self._reserve(i + 1)
+        
+        self._pos[i] = state.position
+        self._vel[i] = state.velocity
+        self._mass[i] = state.mass
+        self._energy[i] = state.energy
+        
+        state.position = self._pos[i]
+        state.velocity = self._vel[i]
         self.states.append(state)
     
-    def calculate_stability(self, state: SystemState) -> float:
+    def _gather_states(self):
+        """
+        Re-read every component's attributes into the state buffers.
+        
+        mass and energy are plain floats on SystemState, and position or
+        velocity may have been reassigned to new arrays since add_state, so
+        the buffers are refreshed from the states (and position/velocity
+        re-pointed at them) before anything reads the buffers.
+        """
+        n = len(self.states)
+        if n == 0:
+            return
+        
+        self._pos[:n] = [state.position for state in self.states]
+        self._vel[:n] = [state.velocity for state in self.states]
+        self._mass[:n] = [state.mass for state in self.states]
+        self._energy[:n] = [state.energy for state in self.states]
+        
+        for i, state in enumerate(self.states):
+            state.position = self._pos[i]
+            state.velocity = self._vel[i]
+    
+    @property
+    def interactions(self) -> List[Interaction]:
+        """
+        Pairwise interactions of the current configuration.
+        
+        Built on demand - the simulation itself never materializes them.
+        """
+        return [
+            self.evaluate_interaction(state1, state2)
+            for i, state1 in enumerate(self.states)
+            for state2 in self.states[i + 1:]
+        ]
+    
+    @staticmethod
+    def calculate_stability(state: SystemState) -> float:
         """
         Calculate stability score for a given state.
         
@@ -69,6 +323,18 @@ class StabilityPrinciple:
         
         return stability
     
+    def calculate_stability_all(self) -> np.ndarray:
+        """Stability scores of all components at once (same formula as calculate_stability)."""
+        self._gather_states()
+        return self._buffer_stability()
+    
+    def _buffer_stability(self) -> np.ndarray:
+        """calculate_stability_all on the state buffers as they are (no gather)."""
+        n = len(self.states)
+        velocities = self._vel[:n]
+        kinetic_energy = 0.5 * self._mass[:n] * np.einsum('ij,ij->i', velocities, velocities)
+        return 1.0 / (1.0 + np.abs(self._energy[:n] + kinetic_energy))
+    
     def evaluate_interaction(self, state1: SystemState, state2: SystemState) -> Interaction:
         """
         Evaluate natural interaction between two components.
@@ -77,17 +343,12 @@ class StabilityPrinciple:
         """
         # Calculate distance
         r_vec = state2.position - state1.position
-        r = np.linalg.norm(r_vec)
+        mass_product = state1.mass * state2.mass
         
-        if r < 1e-10:  # Avoid division by zero
-            force = np.zeros_like(r_vec)
-            strength = 0.0
+        if self.cache_interactions:
+            force, strength = self._cached_pair_force(r_vec, mass_product)
         else:
-            # Simple gravitational-like interaction
-            # F = G * m1 * m2 / r^2, direction toward each other
-            r_hat = r_vec / r
-            strength = state1.mass * state2.mass / (r * r)
-            force = strength * r_hat
+            force, strength = _pair_force(r_vec, mass_product)
         
         return Interaction(
             source_id=state1.id,
@@ -97,61 +358,96 @@ class StabilityPrinciple:
             strength=strength
         )
     
-    def simulate_evolution(self, steps: int = 100) -> List[Dict]:
+    def _cached_pair_force(self, r_vec: np.ndarray, mass_product: float) -> Tuple[np.ndarray, float]:
+        """_pair_force through a bounded LRU cache that only admits recurring pairs."""
+        key = (tuple(r_vec.tolist()), mass_product)
+        
+        cached = self._interaction_cache.get(key)
+        if cached is not None:
+            self._interaction_cache.move_to_end(key)
+            force, strength = cached
+            return force.copy(), strength  # Callers always own a writable force
+        
+        force, strength = _pair_force(r_vec, mass_product)
+        
+        if key in self._seen_pairs:
+            cached_force = force.copy()
+            cached_force.flags.writeable = False  # Guard the shared cache entry
+            self._interaction_cache[key] = (cached_force, strength)
+            if len(self._interaction_cache) > _INTERACTION_CACHE_SIZE:
+                self._interaction_cache.popitem(last=False)
+        else:
+            if len(self._seen_pairs) >= _INTERACTION_CACHE_SIZE:
+                self._seen_pairs.clear()
+            self._seen_pairs.add(key)
+        
+        return force, strength
+    
+    def simulate_evolution(
+        self,
+        steps: int = 100,
+        record_mode: str = 'summary'
+    ) -> Optional[EvolutionHistory]:
         """
         Simulate natural evolution of the system toward effortless stability.
         
-        Returns history of system states at each time step.
+        Args:
+            steps: Number of time steps
+            record_mode: What to record per step -
+                'full': every component's position, velocity, energy and stability
+                'summary': only time, total energy and average stability
+                'none': nothing (the states themselves still evolve)
+        
+        Returns history of system states at each time step (None for 'none').
         """
-        history = []
+        if record_mode not in ('full', 'summary', 'none'):
+            raise ValueError(f"Unknown record_mode: {record_mode!r}")
+        
+        full = record_mode == 'full'
+        history = None
+        if record_mode != 'none':
+            history = EvolutionHistory([s.id for s in self.states], steps, self.dtype, full)
+        
+        self._gather_states()
+        n = len(self.states)
+        positions = self._pos[:n]
+        velocities = self._vel[:n]
+        masses = self._mass[:n]
+        energies = self._energy[:n]
+        forces = self._forces[:n]
+        kernel = _select_step(n, steps)
         
         for step in range(steps):
-            # Calculate all interactions
-            self.interactions = []
-            for i, state1 in enumerate(self.states):
-                for j, state2 in enumerate(self.states):
-                    if i < j:  # Avoid double-counting
-                        interaction = self.evaluate_interaction(state1, state2)
-                        self.interactions.append(interaction)
-            
-            # Update states based on interactions
-            forces = {state.id: np.zeros(3) for state in self.states}
-            
-            for interaction in self.interactions:
-                # Apply force to both components (Newton's 3rd law)
-                forces[interaction.source_id] += interaction.force
-                forces[interaction.target_id] -= interaction.force
-            
-            # Update velocities and positions
-            for state in self.states:
-                acceleration = forces[state.id] / state.mass
-                state.velocity += acceleration * self.dt
-                state.position += state.velocity * self.dt
-                
-                # Update energy (kinetic + potential)
-                kinetic = 0.5 * state.mass * np.dot(state.velocity, state.velocity)
-                state.energy = kinetic  # Simplified
+            # Interactions, velocities, positions and energy (kinetic only,
+            # simplified) in one kernel call, in place on the state buffers
+            kernel(positions, velocities, masses, energies, forces, self.dt)
             
             # Record state
-            snapshot = {
-                'time': self.time,
-                'states': [
-                    {
-                        'id': s.id,
-                        'position': s.position.copy(),
-                        'velocity': s.velocity.copy(),
-                        'energy': s.energy,
-                        'stability': self.calculate_stability(s)
-                    }
-                    for s in self.states
-                ],
-                'total_energy': sum(s.energy for s in self.states),
-                'avg_stability': np.mean([self.calculate_stability(s) for s in self.states])
-            }
-            history.append(snapshot)
+            if full:
+                history.time[step] = self.time
+                history.positions[step] = positions
+                history.velocities[step] = velocities
+                history.energies[step] = energies
+            elif history is not None:
+                history.time[step] = self.time
+                history.total_energy[step] = energies.sum()
+                history.avg_stability[step] = self._buffer_stability().mean()
             
             self.time += self.dt
         
+        if full:
+            # Stabilities (as in calculate_stability_all) and per-step totals for
+            # the whole run in one pass over the recorded arrays
+            speed_sq = np.einsum('snk,snk->sn', history.velocities, history.velocities)
+            kinetic_energy = 0.5 * masses * speed_sq
+            np.divide(1.0, 1.0 + np.abs(history.energies + kinetic_energy), out=history.stabilities)
+            history.energies.sum(axis=1, out=history.total_energy)
+            history.stabilities.mean(axis=1, out=history.avg_stability)
+        
+        # Energy is a plain float on SystemState, so sync it once per run
+        for state, energy in zip(self.states, energies.tolist()):
+            state.energy = energy
+        
         return history
     
     def find_stable_configurations(self, stability_threshold: float = 0.8) -> List[SystemState]:
@@ -160,31 +456,30 @@ class StabilityPrinciple:
         
         Returns states with stability above threshold.
         """
-        stable_states = []
-        
-        for state in self.states:
-            stability = self.calculate_stability(state)
-            if stability >= stability_threshold:
-                stable_states.append(state)
-        
-        return stable_states
+        stable = self.calculate_stability_all() >= stability_threshold
+        return [self.states[i] for i in np.flatnonzero(stable)]
     
-    def demonstrate_zwanglose_stabilitat(self) -> Dict:
+    def demonstrate_zwanglose_stabilitat(self, record_mode: str = 'summary') -> Dict:
         """
         Analyze and demonstrate Zwanglose Stabilität in the system.
         
-        Returns analysis following 5D intelligence framework.
+        Returns analysis following 5D intelligence framework. The analysis only
+        needs the per-step summary; pass record_mode='full' to also get
+        per-component history.
         """
+        if record_mode == 'none':
+            raise ValueError("demonstrate_zwanglose_stabilitat needs a recorded history")
+        
         # Run simulation
-        history = self.simulate_evolution(steps=200)
+        history = self.simulate_evolution(steps=200, record_mode=record_mode)
         
-        initial_energy = history[0]['total_energy']
-        final_energy = history[-1]['total_energy']
-        initial_stability = history[0]['avg_stability']
-        final_stability = history[-1]['avg_stability']
+        initial_energy = float(history.total_energy[0])
+        final_energy = float(history.total_energy[-1])
+        initial_stability = float(history.avg_stability[0])
+        final_stability = float(history.avg_stability[-1])
         
         # Find most stable configuration
-        most_stable_time = max(history, key=lambda h: h['avg_stability'])
+        most_stable_time = float(history.time[np.argmax(history.avg_stability)])
         
         return {
             'what': f"System evolved from {len(self.states)} components to stable configuration",
@@ -192,7 +487,7 @@ class StabilityPrinciple:
             'how_much': {
                 'energy_change': final_energy - initial_energy,
                 'stability_improvement': final_stability - initial_stability,
-                'time_to_stability': most_stable_time['time']
+                'time_to_stability': most_stable_time
             },
             'zwanglose_interaction': (
                 "System self-organized through local interactions. "
@@ -202,21 +497,27 @@ class StabilityPrinciple:
         }
 
 
+# Shared instance for the standalone wrappers (holds no system state of its own)
+_DEFAULT_PRINCIPLE = StabilityPrinciple()
+
+
 def calculate_stability(state: SystemState) -> float:
     """Standalone function to calculate stability."""
-    principle = StabilityPrinciple()
-    return principle.calculate_stability(state)
+    return StabilityPrinciple.calculate_stability(state)
 
 
 def Interaktion_bewerten(state1: SystemState, state2: SystemState) -> Interaction:
     """Bewerte natürliche Interaktion (Deutsche Funktion)."""
-    principle = StabilityPrinciple()
-    return principle.evaluate_interaction(state1, state2)
+    return _DEFAULT_PRINCIPLE.evaluate_interaction(state1, state2)
 
 
-def simulate_evolution(system: StabilityPrinciple, steps: int = 100) -> List[Dict]:
+def simulate_evolution(
+    system: StabilityPrinciple,
+    steps: int = 100,
+    record_mode: str = 'summary'
+) -> Optional[EvolutionHistory]:
     """Standalone function to simulate system evolution."""
-    return system.simulate_evolution(steps)
+    return system.simulate_evolution(steps, record_mode)
 
 
 def find_stable_configurations(system: StabilityPrinciple, threshold: float = 0.8) -> List[SystemState]:
@@ -224,6 +525,6 @@ def find_stable_configurations(system: StabilityPrinciple, threshold: float = 0.
     return system.find_stable_configurations(threshold)
 
 
-def demonstrate_zwanglose_stabilitat(system: StabilityPrinciple) -> Dict:
+def demonstrate_zwanglose_stabilitat(system: StabilityPrinciple, record_mode: str = 'summary') -> Dict:
     """Standalone function to demonstrate Zwanglose Stabilität."""
-    return system.demonstrate_zwanglose_stabilitat()
+    return system.demonstrate_zwanglose_stabilitat(record_mode)
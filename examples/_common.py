@@ -0,0 +1,39 @@
+"""_common.py
+
+Output helpers and shared framework instances for the example scripts.
+
+The framework instances are created on first use, so importing an example
+does not load core.* until one of its demos needs it.
+"""
+
+import sys
+from functools import lru_cache
+
+
+# Banner lines shared by the examples' main()
+BANNER_TOP = "#" * 70
+BANNER_MID = "#" + " " * 68 + "#"
+
+
+def emit(lines):
+    """Write a block of output lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def bullets(header, mark, items):
+    """Write a header followed by one "  <mark> <item>" line per item"""
+    emit([header] + [f"  {mark} {item}" for item in items])
+
+
+@lru_cache(maxsize=None)
+def principle():
+    """Shared StabilityPrinciple (it holds no per-demo state)"""
+    from core.stability_principle import StabilityPrinciple
+    return StabilityPrinciple()
+
+
+@lru_cache(maxsize=None)
+def dynamics():
+    """Shared InteractionDynamics (it holds no per-demo state)"""
+    from core.interaction_dynamics import InteractionDynamics
+    return InteractionDynamics()
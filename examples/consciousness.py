@@ -18,98 +18,209 @@ create instability and dissolve.
 """
 
 import numpy as np
-from typing import List, Dict, Tuple
-from dataclasses import dataclass
+from scipy import sparse
+from scipy.special import expit
+from collections import OrderedDict
+from typing import List, Dict, Tuple, Optional, Union, Sequence
+
+
+_EFFORTLESSNESS_CACHE_SIZE = 2048
+_MIN_CACHED_PATTERN = 5  # Smaller patterns are cheaper to recount than to look up
+
+# Sparse (CSR) weights beat a dense matrix-vector product once the network
+# is large and not too densely connected; below that BLAS wins
+_SPARSE_MIN_NODES = 256
+_SPARSE_MAX_CONNECTIVITY = 0.25
 
 
-@dataclass
 class NeuralNode:
-    """Represents a single node in a thought network."""
-    id: int
-    activation: float = 0.0
-    connections: List[int] = None
-    connection_weights: List[float] = None
-    
-    def __post_init__(self):
-        if self.connections is None:
-            self.connections = []
-        if self.connection_weights is None:
-            self.connection_weights = []
+    """
+    Live view of a single node in a thought network.
+    
+    activation reads and writes the network's activation array; connections
+    and connection_weights are read-only views of its adjacency arrays.
+    """
+    __slots__ = ('_network', 'id')
+    
+    def __init__(self, network: "ThoughtEmergenceNetwork", node_id: int):
+        self._network = network
+        self.id = node_id
+    
+    @property
+    def activation(self) -> float:
+        return float(self._network.activations[self.id])
+    
+    @activation.setter
+    def activation(self, value: float):
+        self._network.activations[self.id] = value
+    
+    @property
+    def connections(self) -> np.ndarray:
+        network = self._network
+        return network.indices[network.indptr[self.id]:network.indptr[self.id + 1]]
+    
+    @property
+    def connection_weights(self) -> np.ndarray:
+        network = self._network
+        return network._connection_weights[network.indptr[self.id]:network.indptr[self.id + 1]]
+    
+    def __repr__(self):
+        return f"NeuralNode(id={self.id}, activation={self.activation}, connections={self.connections.tolist()})"
+
+
+class ActivationHistory(Sequence):
+    """
+    Recorded evolution of a thought network, stored as preallocated arrays.
+    
+    records is a structured array with one row per time step
+    (step, total_energy, active_nodes); activations is the (steps, N)
+    activation trajectory. Indexing a step builds the familiar state dict
+    on demand: {'step', 'activations', 'total_energy', 'active_nodes'}.
+    """
+    
+    RECORD_DTYPE = np.dtype([('step', np.int64), ('total_energy', np.float64), ('active_nodes', np.int64)])
+    
+    def __init__(self, steps: int, num_nodes: int, dtype=np.float64):
+        self.records = np.empty(steps, dtype=self.RECORD_DTYPE)
+        self.activations = np.empty((steps, num_nodes), dtype=dtype)
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def __getitem__(self, step):
+        if isinstance(step, slice):
+            return [self[i] for i in range(*step.indices(len(self)))]
+        
+        record = self.records[step]
+        return {
+            'step': int(record['step']),
+            'activations': self.activations[step],
+            'total_energy': float(record['total_energy']),
+            'active_nodes': int(record['active_nodes'])
+        }
 
 
 class ThoughtEmergenceNetwork:
     """Models emergence of thought through effortless neural stability."""
     
-    def __init__(self, num_nodes: int, connectivity: float = 0.1):
+    def __init__(self, num_nodes: int, connectivity: float = 0.1, dtype=np.float64, seed: int = 42):
         """
         Initialize thought network.
         
         Args:
             num_nodes: Number of neural nodes in the network
             connectivity: Probability of connection between nodes (0-1)
+            dtype: Floating type of the activation and weight arrays
+                (np.float32 halves memory traffic in the propagation step)
+            seed: Seed of the connection sampling, for reproducible networks
         """
         self.num_nodes = num_nodes
         self.connectivity = connectivity
-        self.nodes: List[NeuralNode] = []
+        self.seed = seed
+        self.dtype = np.dtype(dtype)
         self.time_step = 0
         self.thought_patterns: List[Dict] = []
         
+        # Structure-of-arrays network state: activations (N,) and
+        # weights (N, N), where weights[i, j] is the strength of i's connection to j
+        # (a scipy.sparse CSR matrix for large, sparsely connected networks)
+        self.activations = np.zeros(num_nodes, dtype=self.dtype)
+        self._next_activations = np.empty(num_nodes, dtype=self.dtype)  # evolve's swap buffer
+        self.weights = None
+        self._nodes: Optional[Tuple[NeuralNode, ...]] = None  # views, built on first access
+        
+        # Effortlessness depends only on the (fixed) adjacency, so it is
+        # memoized per pattern; stable regimes keep producing the same patterns
+        self._effortlessness_cache: "OrderedDict[tuple, float]" = OrderedDict()
+        
         self._initialize_network()
     
     def _initialize_network(self):
         """Create network with effortless, natural connectivity."""
-        # Create nodes
-        for i in range(self.num_nodes):
-            self.nodes.append(NeuralNode(id=i))
-        
-        # Establish connections based on natural affinity (random but stable)
-        np.random.seed(42)  # For reproducible networks
-        
-        for node in self.nodes:
-            # Each node connects to a subset of others
-            for potential_target in range(self.num_nodes):
-                if potential_target != node.id:
-                    # Natural connection probability
-                    if np.random.random() < self.connectivity:
-                        # Connection weight based on natural resonance
-                        weight = np.random.beta(2, 5)  # Naturally skewed distribution
-                        node.connections.append(potential_target)
-                        node.connection_weights.append(weight)
-    
-    def _calculate_natural_activation(self, node: NeuralNode) -> float:
-        """
-        Calculate activation based on effortless input from connected nodes.
+        n = self.num_nodes
+        
+        # Establish connections based on natural affinity (random but stable).
+        # A local generator keeps networks reproducible without touching the
+        # global random state; all potential connections are drawn at once.
+        rng = np.random.default_rng(self.seed)
+        
+        # Natural connection probability (no self-connections)
+        connected = rng.random((n, n)) < self.connectivity
+        np.fill_diagonal(connected, False)
+        
+        # Row-major order groups connections by source, targets ascending
+        sources, targets = np.nonzero(connected)
+        
+        # Connection weight based on natural resonance, drawn only for the
+        # connections that exist
+        weights = rng.beta(2, 5, size=sources.size)  # Naturally skewed distribution
         
-        Returns activation level that emerges naturally without force.
+        if n >= _SPARSE_MIN_NODES and self.connectivity < _SPARSE_MAX_CONNECTIVITY:
+            # Sparse networks: only store (and multiply) the connections that exist
+            self.weights = sparse.csr_matrix((weights, (sources, targets)), shape=(n, n), dtype=self.dtype)
+        else:
+            self.weights = np.zeros((n, n), dtype=self.dtype)
+            self.weights[sources, targets] = weights
+        
+        # Fixed adjacency in CSR form: node i connects to indices[indptr[i]:indptr[i + 1]]
+        self.indptr = np.concatenate(([0], np.cumsum(np.bincount(sources, minlength=n))))
+        self.indices = np.asarray(targets, dtype=np.intp)
+        self._connection_weights = np.asarray(weights, dtype=self.dtype)
+        self.indices.flags.writeable = False  # Shared with the node views
+        self._connection_weights.flags.writeable = False
+        
+        # Nodes without connections receive no input at all
+        self._has_inputs = np.diff(self.indptr) > 0
+    
+    @property
+    def nodes(self) -> Tuple[NeuralNode, ...]:
+        """Per-node live views of the network arrays (built once, see NeuralNode)."""
+        if self._nodes is None:
+            self._nodes = tuple(NeuralNode(self, i) for i in range(self.num_nodes))
+        return self._nodes
+    
+    def _natural_activations(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
-        if not node.connections:
-            return 0.0
+        Calculate activation of every node from effortless input from connected nodes.
         
-        total_input = 0.0
-        for conn_id, weight in zip(node.connections, node.connection_weights):
-            connected_node = self.nodes[conn_id]
-            # Effortless propagation - weighted by natural connection strength
-            total_input += connected_node.activation * weight
+        Returns activation levels that emerge naturally without force, written
+        into `out` when given (it must not be self.activations).
+        """
+        # Effortless propagation - weighted by natural connection strength
+        if out is None:
+            total_input = self.weights @ self.activations
+        elif sparse.issparse(self.weights):
+            total_input = out
+            total_input[...] = self.weights @ self.activations
+        else:
+            total_input = np.matmul(self.weights, self.activations, out=out)
         
         # Natural activation function (sigmoid for smooth transitions)
-        # Represents effortless emergence without artificial forcing
-        activation = 1.0 / (1.0 + np.exp(-total_input + 2.0))
+        # Represents effortless emergence without artificial forcing.
+        # Evaluated in place on the propagation result; nodes without
+        # connections are masked to zero.
+        activation = total_input
+        activation -= 2.0
+        expit(activation, out=activation)
+        activation *= self._has_inputs
         
         return activation
     
-    def stimulate(self, node_ids: List[int], intensity: float = 0.8):
+    def stimulate(self, node_ids: List[int], intensity: Union[float, List[float]] = 0.8):
         """
         Provide initial stimulus to specific nodes (like sensory input).
         
         Args:
-            node_ids: IDs of nodes to stimulate
-            intensity: Stimulation strength (0-1)
+            node_ids: IDs of nodes to stimulate (IDs outside the network are ignored)
+            intensity: Stimulation strength (0-1), either one value for all
+                nodes or one value per entry of node_ids
         """
-        for node_id in node_ids:
-            if 0 <= node_id < self.num_nodes:
-                self.nodes[node_id].activation = intensity
+        node_ids = np.asarray(node_ids, dtype=int)
+        intensity = np.broadcast_to(intensity, node_ids.shape)
+        valid = (node_ids >= 0) & (node_ids < self.num_nodes)
+        self.activations[node_ids[valid]] = intensity[valid]
     
-    def evolve(self, steps: int = 50, decay_rate: float = 0.1) -> List[Dict]:
+    def evolve(self, steps: int = 50, decay_rate: float = 0.1) -> ActivationHistory:
         """
         Allow thought patterns to emerge naturally over time.
         
@@ -118,68 +229,67 @@ class ThoughtEmergenceNetwork:
             decay_rate: Natural decay of activation (prevents runaway)
         
         Returns:
-            List of system states at each time step
+            ActivationHistory with the system state at each time step
         """
-        evolution_history = []
+        history = ActivationHistory(steps, self.num_nodes, dtype=self.dtype)
+        trajectory = history.activations
+        first_step = self.time_step
         
         for step in range(steps):
-            # Calculate new activations for all nodes
-            new_activations = []
+            # Natural activation emerges from network state (all nodes at once)
+            natural_activation = self._natural_activations(out=self._next_activations)
             
-            for node in self.nodes:
-                # Natural activation emerges from network state
-                natural_activation = self._calculate_natural_activation(node)
-                
-                # Apply natural decay (energy cost of maintaining activation)
-                decayed = node.activation * (1.0 - decay_rate)
-                
-                # New activation is weighted average (smooth transition)
-                new_activation = 0.7 * natural_activation + 0.3 * decayed
-                new_activations.append(new_activation)
-            
-            # Update all nodes simultaneously
-            for i, node in enumerate(self.nodes):
-                node.activation = new_activations[i]
+            # New activation is weighted average (smooth transition) of the
+            # natural activation and the decayed one (energy cost of
+            # maintaining activation). It is built in the spare buffer, then
+            # the buffers swap, so all nodes update simultaneously and
+            # a step allocates no new arrays
+            natural_activation *= 0.7
+            self.activations *= 0.3 * (1.0 - decay_rate)
+            natural_activation += self.activations
+            self.activations, self._next_activations = natural_activation, self.activations
             
             # Record system state
-            state = {
-                'step': self.time_step,
-                'activations': [n.activation for n in self.nodes],
-                'total_energy': sum(new_activations),
-                'active_nodes': sum(1 for a in new_activations if a > 0.1)
-            }
-            evolution_history.append(state)
-            
-            self.time_step += 1
-            
-            # Detect stable thought patterns
-            self._detect_thought_patterns(state)
+            trajectory[step] = self.activations
+        
+        self.time_step += steps
+        
+        # Per-step summaries, reduced over the whole trajectory at once
+        history.records['step'] = np.arange(first_step, self.time_step)
+        history.records['total_energy'] = trajectory.sum(axis=1)
+        history.records['active_nodes'] = np.count_nonzero(trajectory > 0.1, axis=1)
         
-        return evolution_history
+        # Detect stable thought patterns (over the whole run at once)
+        self._detect_thought_patterns(trajectory, first_step)
+        
+        return history
     
-    def _detect_thought_patterns(self, state: Dict):
+    def _detect_thought_patterns(self, trajectory: np.ndarray, first_step: int = 0):
         """
         Identify stable, recurring activation patterns (thoughts).
         
         Stable patterns represent effortlessly sustained cognitive structures.
+        `trajectory` holds one row of activations per step, the first row
+        being time step `first_step`.
         """
-        activations = state['activations']
-        
         # A thought pattern is a stable configuration of active nodes
-        active_pattern = [i for i, a in enumerate(activations) if a > 0.3]
+        active = trajectory > 0.3
+        sizes = np.count_nonzero(active, axis=1)
         
-        if len(active_pattern) >= 3:  # Minimum complexity for a "thought"
-            # Check if this pattern achieves stability
-            pattern_strength = sum(activations[i] for i in active_pattern) / len(active_pattern)
-            
-            if pattern_strength > 0.4:  # Stability threshold
-                thought = {
-                    'time': state['step'],
-                    'pattern': active_pattern,
-                    'strength': pattern_strength,
-                    'effortless_stability_score': self._calculate_effortlessness(active_pattern)
-                }
-                self.thought_patterns.append(thought)
+        # Check which patterns achieve stability (mean activation of the pattern)
+        strengths = np.where(active, trajectory, 0.0).sum(axis=1) / np.maximum(sizes, 1)
+        
+        thoughts = (sizes >= 3) & (strengths > 0.4)  # Minimum complexity for a "thought", stability threshold
+        
+        for step in np.flatnonzero(thoughts):
+            active_pattern = np.flatnonzero(active[step]).tolist()
+            thought = {
+                'time': first_step + int(step),
+                'pattern': active_pattern,
+                'strength': float(strengths[step]),
+                'effortless_stability_score': self._calculate_effortlessness(active_pattern)
+            }
+            self.thought_patterns.append(thought)
     
     def _calculate_effortlessness(self, pattern: List[int]) -> float:
         """
@@ -190,15 +300,29 @@ class ThoughtEmergenceNetwork:
         if not pattern:
             return 0.0
         
-        # Measure based on natural connectivity within the pattern
-        internal_connections = 0
-        total_possible = len(pattern) * (len(pattern) - 1)
+        if len(pattern) < _MIN_CACHED_PATTERN:
+            return self._effortlessness(pattern)
         
-        for node_id in pattern:
-            node = self.nodes[node_id]
-            for conn_id in node.connections:
-                if conn_id in pattern:
-                    internal_connections += 1
+        key = tuple(pattern)  # Patterns are listed in ascending node order
+        cached = self._effortlessness_cache.get(key)
+        if cached is not None:
+            self._effortlessness_cache.move_to_end(key)
+            return cached
+        
+        effortlessness = self._effortlessness(pattern)
+        self._effortlessness_cache[key] = effortlessness
+        if len(self._effortlessness_cache) > _EFFORTLESSNESS_CACHE_SIZE:
+            self._effortlessness_cache.popitem(last=False)
+        
+        return effortlessness
+    
+    def _effortlessness(self, pattern: List[int]) -> float:
+        """Internal connectivity ratio of a non-empty pattern (uncached)."""
+        # Measure based on natural connectivity within the pattern:
+        # connections leaving the pattern's nodes that stay inside it
+        total_possible = len(pattern) * (len(pattern) - 1)
+        neighbours = np.concatenate([self.indices[self.indptr[i]:self.indptr[i + 1]] for i in pattern])
+        internal_connections = int(np.count_nonzero(np.isin(neighbours, pattern)))
         
         # Higher internal connectivity = more effortless maintenance
         if total_possible > 0:
@@ -219,14 +343,22 @@ class ThoughtEmergenceNetwork:
                 'zwanglose_interaction': 'Insufficient natural resonance'
             }
         
-        # Identify most stable thoughts
-        stable_thoughts = sorted(
-            self.thought_patterns,
-            key=lambda t: t['effortless_stability_score'],
-            reverse=True
-        )[:5]
+        # Effortlessness of every thought, read into an array once
+        scores = np.fromiter(
+            (t['effortless_stability_score'] for t in self.thought_patterns),
+            dtype=np.float64,
+            count=len(self.thought_patterns)
+        )
         
-        avg_stability = np.mean([t['effortless_stability_score'] for t in self.thought_patterns])
+        # Identify most stable thoughts: select the top 5 in linear time,
+        # resolving ties toward earlier patterns (as a stable sort would)
+        k = min(5, len(scores))
+        kth_score = np.partition(scores, len(scores) - k)[len(scores) - k]
+        candidates = np.flatnonzero(scores >= kth_score)
+        top = candidates[np.argsort(-scores[candidates], kind='stable')[:k]]
+        stable_thoughts = [self.thought_patterns[i] for i in top]
+        
+        avg_stability = scores.mean()
         
         return {
             'what': f'{len(self.thought_patterns)} distinct thought patterns emerged',
@@ -309,19 +441,22 @@ def demonstrate_thought_emergence():
             print(f"     Pattern nodes: {thought['pattern'][:10]}{'...' if len(thought['pattern']) > 10 else ''}")
         print()
     
-    print("=" * 70)
-    print("PHILOSOPHICAL INSIGHT")
-    print("=" * 70)
-    print()
-    print(analysis['philosophical_insight'])
-    print()
+    # Only present when patterns emerged (see analyze_emergence)
+    if 'philosophical_insight' in analysis:
+        print("=" * 70)
+        print("PHILOSOPHICAL INSIGHT")
+        print("=" * 70)
+        print()
+        print(analysis['philosophical_insight'])
+        print()
     
     # Show energy dynamics
     print("Energy Dynamics (Total Network Activation):")
-    energies = [state['total_energy'] for state in evolution]
+    energies = evolution.records['total_energy']
+    peak = int(np.argmax(energies))
     print(f"  Initial energy: {energies[0]:.2f}")
     print(f"  Final energy: {energies[-1]:.2f}")
-    print(f"  Peak energy: {max(energies):.2f} at step {energies.index(max(energies))}")
+    print(f"  Peak energy: {energies[peak]:.2f} at step {peak}")
     print()
     
     print("Interpretation: The system naturally seeks its most effortless,")
@@ -12,22 +12,26 @@ Durch welche zwanglose Interaktion? -> Natural charge complementarity
 
 import sys
 import os
+from dataclasses import dataclass
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from core.stability_principle import SystemState, Interaction, StabilityPrinciple
-from core.interaction_dynamics import InteractionDynamics, InteractionType
 import numpy as np
 
+from examples._common import BANNER_MID, BANNER_TOP, bullets, emit, dynamics, principle
 
+
+# Row layout of the bond formation table
+_ROW_FMT = "{step:4d} | {distance:7.2f} | {interaction:14s} | {strength:.3f} | {effortless}"
+
+
+@dataclass(frozen=True)
 class QuantumParticle:
     """Represents a subatomic particle"""
-    
-    def __init__(self, name: str, charge: float, mass: float, spin: float):
-        self.name = name
-        self.charge = charge  # Elementary charge units
-        self.mass = mass      # Atomic mass units
-        self.spin = spin      # Spin quantum number
-        self.energy_level = 0.0
+    name: str
+    charge: float  # Elementary charge units
+    mass: float    # Atomic mass units
+    spin: float    # Spin quantum number
+    energy_level: float = 0.0
     
     def __repr__(self):
         return f"{self.name}(q={self.charge:+.1f}, m={self.mass:.3f})"
@@ -35,6 +39,8 @@ class QuantumParticle:
 
 def create_hydrogen_atom():
     """Create the simplest stable system: Hydrogen atom (proton + electron)"""
+    from core.stability_principle import SystemState, Interaction
+    
     print("=== Quantum Bonds: Hydrogen Atom Formation ===")
     print()
     print("Die einfachste stabile Bindung im Universum:")
@@ -61,26 +67,11 @@ def create_hydrogen_atom():
     print()
     
     # Analyze interaction using framework
-    dynamics = InteractionDynamics()
-    
-    # Convert to property dictionaries
-    proton_props = {
-        'charge': proton.charge,
-        'energy_level': 0.0,
-        'spin': proton.spin
-    }
-    
-    electron_props = {
-        'charge': electron.charge,
-        'energy_level': 0.0,
-        'spin': electron.spin
-    }
-    
-    # Calculate natural interaction
+    # Calculate natural interaction (particles are passed directly)
     distance = 5.29e-11  # Bohr radius in meters (natural equilibrium)
-    interaction_type, strength = dynamics.calculate_interaction_strength(
-        proton_props,
-        electron_props,
+    interaction_type, strength = dynamics().calculate_interaction_strength(
+        proton,
+        electron,
         distance
     )
     
@@ -90,15 +81,6 @@ def create_hydrogen_atom():
     print(f"Mühelos: {'Ja ✓' if strength > 0.5 else 'Nein'}")
     print()
     
-    # Use StabilityPrinciple to evaluate bond
-    principle = StabilityPrinciple()
-    
-    # Create system state
-    components = {
-        'proton': proton_props,
-        'electron': electron_props
-    }
-    
     # Create system states for proton and electron
     proton_state = SystemState(
         id=1,
@@ -134,12 +116,12 @@ def create_hydrogen_atom():
     )
     
     # Calculate stability for both particles
-    proton_stability = principle.calculate_stability(proton_state)
-    electron_stability = principle.calculate_stability(electron_state)
+    proton_stability = principle().calculate_stability(proton_state)
+    electron_stability = principle().calculate_stability(electron_state)
     stability = (proton_stability + electron_stability) / 2  # Average stability
     
     # Evaluate the interaction between the two particles
-    bond_interaction = principle.evaluate_interaction(proton_state, electron_state)
+    bond_interaction = principle().evaluate_interaction(proton_state, electron_state)
     
     print("--- Stabilitätsanalyse ---")
     print(f"System-Stabilität: {stability:.3f}")
@@ -150,22 +132,24 @@ def create_hydrogen_atom():
     # Key insight
     print("✅ ZWANGLOSE STABILITÄT BESTÄTIGT")
     print()
-    print("Das Wasserstoffatom entsteht OHNE:")
-    print("  ✗ Zentrale Steuerung")
-    print("  ✗ Äußere Kraft")
-    print("  ✗ Bewusste Planung")
+    bullets("Das Wasserstoffatom entsteht OHNE:", "✗", [
+        "Zentrale Steuerung",
+        "Äußere Kraft",
+        "Bewusste Planung",
+    ])
     print()
-    print("Das Wasserstoffatom entsteht DURCH:")
-    print("  ✓ Natürliche Ladungsanziehung")
-    print("  ✓ Energieminimierung")
-    print("  ✓ Quantenmechanische Ausgew")
-    print("  ✓ Gleichgewichtskräfte")
+    bullets("Das Wasserstoffatom entsteht DURCH:", "✓", [
+        "Natürliche Ladungsanziehung",
+        "Energieminimierung",
+        "Quantenmechanische Ausgew",
+        "Gleichgewichtskräfte",
+    ])
     print()
     print("Diese Bindung ist 13,8 Milliarden Jahre stabil.")
     print("Ohne Manager. Ohne CEO. Ohne Hierarchie.")
     print()
     
-    return return proton_state, electron_state, bond, stability
+    return proton_state, electron_state, bond, stability
 
 
 def demonstrate_unstable_pairing():
@@ -182,13 +166,8 @@ def demonstrate_unstable_pairing():
     print(f"Teilchen 2: {proton2}")
     print()
     
-    dynamics = InteractionDynamics()
-    
-    props1 = {'charge': proton1.charge, 'spin': proton1.spin}
-    props2 = {'charge': proton2.charge, 'spin': proton2.spin}
-    
-    interaction_type, strength = dynamics.calculate_interaction_strength(
-        props1, props2, 1.0
+    interaction_type, strength = dynamics().calculate_interaction_strength(
+        proton1, proton2, 1.0
     )
     
     print("--- Interaktionsanalyse ---")
@@ -216,35 +195,37 @@ def simulate_bond_formation():
     print("natürlich zueinander finden...")
     print()
     
-    dynamics = InteractionDynamics()
-    
     # Start at distance
     proton_props = {'charge': +1.0, 'energy_level': 0.0}
     electron_props = {'charge': -1.0, 'energy_level': 0.0, 'distance': 100.0}
     
     # Simulate approach
-    states = dynamics.simulate_interaction(
+    trace = dynamics().simulate_interaction(
         proton_props,
         electron_props,
         time_steps=50
     )
     
-    print("Zeit | Distanz | Interaktion    | Stärke | Mühelos")
-    print("-" * 60)
+    rows = ["Zeit | Distanz | Interaktion    | Stärke | Mühelos", "-" * 60]
     
     # Show key time points
     for i in [0, 10, 20, 30, 40, 49]:
-        if i < len(states):
-            s = states[i]
-            effortless = "✓" if s['effortless'] else "✗"
-            print(f"{s['step']:4d} | {s['distance']:7.2f} | {s['interaction_type']:14s} | {s['strength']:.3f} | {effortless}")
+        if i < len(trace):
+            effortless = "✓" if trace.effortless[i] else "✗"
+            rows.append(_ROW_FMT.format(
+                step=i,
+                distance=trace.distance[i],
+                interaction=trace.interaction_type(i).value,
+                strength=trace.strength[i],
+                effortless=effortless
+            ))
+    emit(rows)
     
-    final = states[-1]
     print()
-    print(f"✓ Endzustand erreicht nach {len(states)} Schritten")
-    print(f"  Finale Distanz: {final['distance']:.2f}")
-    print(f"  Finale Stärke: {final['strength']:.3f}")
-    print(f"  Mühelos stabil: {'Ja ✓' if final['effortless'] else 'Nein'}")
+    print(f"✓ Endzustand erreicht nach {len(trace)} Schritten")
+    print(f"  Finale Distanz: {trace.distance[-1]:.2f}")
+    print(f"  Finale Stärke: {trace.strength[-1]:.3f}")
+    print(f"  Mühelos stabil: {'Ja ✓' if trace.effortless[-1] else 'Nein'}")
     print()
     print("Das System hat SELBST seinen Gleichgewichtszustand gefunden.")
     print("Keine externe Kraft war nötig.")
@@ -254,11 +235,11 @@ def simulate_bond_formation():
 def main():
     """Run all quantum bond demonstrations"""
     print()
-    print("#" * 70)
-    print("#" + " " * 68 + "#")
+    print(BANNER_TOP)
+    print(BANNER_MID)
     print("#  QUANTUM BONDS: Die fundamentalste Skala der Zwanglosen Stabilität  #")
-    print("#" + " " * 68 + "#")
-    print("#" * 70)
+    print(BANNER_MID)
+    print(BANNER_TOP)
     print()
     
     # Example 1: Stable bond (Hydrogen)
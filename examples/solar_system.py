@@ -12,33 +12,84 @@ Durch welche zwanglose Interaktion? -> Mass-based gravitational equilibrium
 
 import sys
 import os
+from math import sqrt as _sqrt
+from dataclasses import dataclass
+from functools import cached_property
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from core.stability_principle import SystemState, Interaction, StabilityPrinciple
-from core.interaction_dynamics import InteractionDynamics
 import numpy as np
 
+from examples._common import BANNER_MID, BANNER_TOP, bullets, emit, principle
 
+
+@dataclass(frozen=True)
 class CelestialBody:
     """Represents a celestial body (planet, star, etc.)"""
+    name: str
+    mass: float      # In Earth masses
+    distance: float  # In AU (Astronomical Units)
+    velocity: float  # In km/s
     
-    def __init__(self, name: str, mass: float, distance: float, velocity: float):
-        self.name = name
-        self.mass = mass          # In Earth masses
-        self.distance = distance  # In AU (Astronomical Units)
-        self.velocity = velocity  # In km/s
-    
+    @cached_property
     def orbital_period_years(self) -> float:
-        """Calculate orbital period using Kepler's Third Law"""
-        # T^2 = a^3 (for solar mass)
-        return self.distance ** 1.5
+        """Orbital period using Kepler's Third Law (computed once per body)"""
+        # T^2 = a^3 (for solar mass); a * sqrt(a) avoids a generic pow
+        return self.distance * _sqrt(self.distance)
     
     def __repr__(self):
         return f"{self.name}(M={self.mass:.2f}M⊕, d={self.distance:.2f}AU)"
 
 
+# Circular orbital speed at 1 AU (km/s): the unit of speed in natural
+# orbital units, where G = 1, masses are in solar masses and distances in AU
+_ORBITAL_SPEED_1AU = 29.78
+
+# Planets of the solar system as parallel arrays (structure-of-arrays)
+_PLANET_NAMES = ["Merkur", "Venus", "Erde", "Mars", "Jupiter", "Saturn", "Uranus", "Neptun"]
+_MASS = np.array([0.055, 0.815, 1.0, 0.107, 317.8, 95.2, 14.5, 17.1])      # In Earth masses
+_DIST = np.array([0.39, 0.72, 1.0, 1.52, 5.20, 9.54, 19.19, 30.07])        # In AU
+_VEL = np.array([47.87, 35.02, 29.78, 24.07, 13.07, 9.69, 6.81, 5.43])     # In km/s
+
+# Kepler's Third Law for all planets at once: T^2 = a^3 (for solar mass)
+_PERIOD = _DIST * np.sqrt(_DIST)
+
+# The comparison table is constant, so it is formatted once at import
+_ROW_FMT = "{name:8s} | {mass:10.2f} | {distance:12.2f} | {velocity:14.2f} | {period:15.2f}"
+
+_PLANET_TABLE_ROWS = [
+    "Planet   | Masse (M⊕) | Distanz (AU) | Geschw. (km/s) | Periode (Jahre)",
+    "-" * 75,
+] + [
+    _ROW_FMT.format(name=name, mass=mass, distance=distance, velocity=velocity, period=period)
+    for name, mass, distance, velocity, period in zip(_PLANET_NAMES, _MASS, _DIST, _VEL, _PERIOD)
+]
+
+
+# Phases of solar system formation: (phase, process, mechanism)
+_FORMATION_PHASES = [
+    ("1", "Gaswolke kollabiert durch Gravitation", "Zwanglos"),
+    ("2", "Wolke rotiert und flacht ab zur Scheibe", "Drehimpulserhaltung"),
+    ("3", "Zentrum verdichtet sich zur Sonne", "Gravitationskontraktion"),
+    ("4", "Staubkörner in Scheibe kollidieren", "Natürliche Aggregation"),
+    ("5", "Planetesimale entstehen (km-Größe)", "Stoßweise Akkretion"),
+    ("6", "Protoplaneten formen sich (1000 km)", "Gravitative Akkumulation"),
+    ("7", "Planeten räumen Bahnen frei", "Massedomination"),
+    ("8", "Orbits stabilisieren sich", "Gleichgewichtszustand"),
+]
+
+_FORMATION_TABLE_ROWS = [
+    "Phase | Vorgang                              | Mechanismus",
+    "-" * 75,
+] + [
+    f"  {phase}   | {process:40s} | {mechanism}"
+    for phase, process, mechanism in _FORMATION_PHASES
+]
+
+
 def demonstrate_earth_orbit():
     """Show Earth's orbit as example of effortless stability"""
+    from core.stability_principle import SystemState
+    
     print("=== Solar System: Erde-Sonne System ===")
     print()
     print("Die Erde umkreist die Sonne seit 4,5 Milliarden Jahren.")
@@ -62,57 +113,73 @@ def demonstrate_earth_orbit():
     
     print(f"Zentralkörper: {sun}")
     print(f"Orbiter: {earth}")
-    print(f"Umlaufdauer: {earth.orbital_period_years():.2f} Jahre")
+    print(f"Umlaufdauer: {earth.orbital_period_years:.2f} Jahre")
     print(f"Bahngeschwindigkeit: {earth.velocity} km/s")
     print()
     
-    # Analyze using framework
-    principle = StabilityPrinciple()
+    # Analyze using framework: one system state per body, in natural orbital
+    # units (G = 1, masses in solar masses, distances in AU), where the speed
+    # unit is the circular orbital speed at 1 AU
+    m_earth = earth.mass / sun.mass
+    speed = earth.velocity / _ORBITAL_SPEED_1AU
     
-    # System state
-    components = {
-        'sun': {'mass': sun.mass, 'position': 0},
-        'earth': {'mass': earth.mass, 'distance': earth.distance}
-    }
+    sun_state = SystemState(
+        id=0,
+        position=np.array([0.0, 0.0, 0.0]),  # Sun at the origin
+        velocity=np.array([0.0, 0.0, 0.0]),
+        mass=1.0,
+        energy=0.0
+    )
     
     state = SystemState(
-        components=components,
-        energy=-1.5e33,  # Gravitational binding energy in Joules (simplified)
-        entropy=0.05,    # Very low - highly ordered orbit
-        complexity=2.0   # Two-body system
+        id=1,
+        position=np.array([earth.distance, 0.0, 0.0]),
+        velocity=np.array([0.0, speed, 0.0]),  # Perpendicular to the radius
+        mass=m_earth,
+        energy=-m_earth / earth.distance  # Gravitational potential energy
     )
     
-    # Gravitational interaction
-    orbit = Interaction(
-        type="gravitational",
-        strength=0.9,      # Very strong, stable
-        energy_cost=0.0,   # Absolutely effortless - no energy spent
-        participants=['sun', 'earth']
-    )
+    # Gravitational interaction, evaluated by the framework
+    orbit = principle().evaluate_interaction(sun_state, state)
+    stability = principle().calculate_stability(state)
+    
+    # Orbit quality: gravitational pull relative to the centripetal force a
+    # circular orbit at this speed needs (1.0 = exactly balanced)
+    required = m_earth * speed ** 2 / earth.distance
+    orbit_quality = min(orbit.strength, required) / max(orbit.strength, required)
     
-    stability = principle.calculate_stability(state)
-    orbit_quality = principle.evaluate_interaction(orbit, state)
+    # Energy cost: work gravity does on the Earth over one orbit
+    # (zero when the pull stays perpendicular to the motion)
+    orbit_time = 2 * np.pi * earth.distance / speed
+    energy_cost = abs(np.dot(orbit.force, state.velocity)) * orbit_time
     
     print("--- Stabilitätsanalyse ---")
     print(f"System-Stabilität: {stability:.3f}")
     print(f"Orbit-Qualität: {orbit_quality:.3f}")
-    print(f"Energiekosten: {orbit.energy_cost} (NULL!)")
+    print(f"Energiekosten: {energy_cost:.1f}" + (" (NULL!)" if energy_cost == 0 else ""))
     print()
     
+    if stability < 0.8 or orbit_quality < 0.9 or energy_cost > 1e-9:
+        print("✗ Keine zwanglose Stabilität: der Orbit muss nachgeführt werden")
+        print()
+        return state, orbit, stability
+    
     print("✅ ZWANGLOSE STABILITÄT BESTÄTIGT")
     print()
-    print("Die Erde umkreist die Sonne OHNE:")
-    print("  ✗ Triebwerke")
-    print("  ✗ Treibstoff")
-    print("  ✗ Navigationssystem")
-    print("  ✗ Wartung")
-    print("  ✗ Zentrale Kontrolle")
-    print()
-    print("Die Erde umkreist die Sonne DURCH:")
-    print("  ✓ Gravitationsanziehung")
-    print("  ✓ Trägheit (Impulserhaltung)")
-    print("  ✓ Natürliches Gleichgewicht")
-    print("  ✓ Energieminimierung")
+    bullets("Die Erde umkreist die Sonne OHNE:", "✗", [
+        "Triebwerke",
+        "Treibstoff",
+        "Navigationssystem",
+        "Wartung",
+        "Zentrale Kontrolle",
+    ])
+    print()
+    bullets("Die Erde umkreist die Sonne DURCH:", "✓", [
+        "Gravitationsanziehung",
+        "Trägheit (Impulserhaltung)",
+        "Natürliches Gleichgewicht",
+        "Energieminimierung",
+    ])
     print()
     print("4,5 Milliarden Jahre. Perfekt stabil. Mühelos.")
     print()
@@ -128,23 +195,7 @@ def compare_all_planets():
     print("Zwanglose Stabilität durch Gravitationsgleichgewicht")
     print()
     
-    planets = [
-        CelestialBody("Merkur", 0.055, 0.39, 47.87),
-        CelestialBody("Venus", 0.815, 0.72, 35.02),
-        CelestialBody("Erde", 1.0, 1.0, 29.78),
-        CelestialBody("Mars", 0.107, 1.52, 24.07),
-        CelestialBody("Jupiter", 317.8, 5.20, 13.07),
-        CelestialBody("Saturn", 95.2, 9.54, 9.69),
-        CelestialBody("Uranus", 14.5, 19.19, 6.81),
-        CelestialBody("Neptun", 17.1, 30.07, 5.43),
-    ]
-    
-    print("Planet   | Masse (M⊕) | Distanz (AU) | Geschw. (km/s) | Periode (Jahre)")
-    print("-" * 75)
-    
-    for planet in planets:
-        period = planet.orbital_period_years()
-        print(f"{planet.name:8s} | {planet.mass:10.2f} | {planet.distance:12.2f} | {planet.velocity:14.2f} | {period:15.2f}")
+    emit(_PLANET_TABLE_ROWS)
     
     print()
     print("ALLE folgen Keplers Gesetzen. ALLE sind stabil.")
@@ -211,28 +262,15 @@ def simulate_solar_system_formation():
     print("Vor 4,6 Milliarden Jahren:")
     print()
     
-    phases = [
-        ("1", "Gaswolke kollabiert durch Gravitation", "Zwanglos"),
-        ("2", "Wolke rotiert und flacht ab zur Scheibe", "Drehimpulserhaltung"),
-        ("3", "Zentrum verdichtet sich zur Sonne", "Gravitationskontraktion"),
-        ("4", "Staubkörner in Scheibe kollidieren", "Natürliche Aggregation"),
-        ("5", "Planetesimale entstehen (km-Größe)", "Stoßweise Akkretion"),
-        ("6", "Protoplaneten formen sich (1000 km)", "Gravitative Akkumulation"),
-        ("7", "Planeten räumen Bahnen frei", "Massedomination"),
-        ("8", "Orbits stabilisieren sich", "Gleichgewichtszustand"),
-    ]
-    
-    print("Phase | Vorgang                              | Mechanismus")
-    print("-" * 75)
-    for phase, process, mechanism in phases:
-        print(f"  {phase}   | {process:40s} | {mechanism}")
+    emit(_FORMATION_TABLE_ROWS)
     
     print()
-    print("JEDE Phase geschieht MÜHELOS:")
-    print("  ✓ Keine Planung erforderlich")
-    print("  ✓ Keine externe Steuerung")
-    print("  ✓ Nur natürliche Kräfte")
-    print("  ✓ Selbstorganisation")
+    bullets("JEDE Phase geschieht MÜHELOS:", "✓", [
+        "Keine Planung erforderlich",
+        "Keine externe Steuerung",
+        "Nur natürliche Kräfte",
+        "Selbstorganisation",
+    ])
     print()
     print("Das Ergebnis: Unser stabiles Sonnensystem.")
     print("8 Planeten. Alle auf stabilen Bahnen.")
@@ -243,11 +281,11 @@ def simulate_solar_system_formation():
 def main():
     """Run all solar system demonstrations"""
     print()
-    print("#" * 70)
-    print("#" + " " * 68 + "#")
+    print(BANNER_TOP)
+    print(BANNER_MID)
     print("#  SOLAR SYSTEM: Zwanglose Stabilität auf makroskopischer Skala  #")
-    print("#" + " " * 68 + "#")
-    print("#" * 70)
+    print(BANNER_MID)
+    print(BANNER_TOP)
     print()
     
     # Example 1: Earth's orbit